@@ -71,41 +71,115 @@ Notes
 
 from __future__ import annotations
 
+import hashlib
 import math
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; batch simulation falls back to NumPy
+    njit = None
 
 ItemId = str
 Attributes = Mapping[str, str]
 ItemsDict = Mapping[ItemId, Attributes]
 
 
+# Module-level registries of DP results, keyed by a canonical fingerprint
+# of the factorized attribute table.  Batched runs that rebuild a
+# KaryOracleDP over the same items (e.g. one instance per seed or per
+# process stage) then share one memo, instead of re-solving every state
+# from scratch per instance.  The DP solution depends only on the
+# attribute names and the integer code matrix, which is exactly what the
+# fingerprint covers; state keys inside each memo are the canonical int
+# bitsets.
+_SHARED_MEMOS: Dict[bytes, Dict[int, Tuple[float, Optional[str]]]] = {}
+_SHARED_CONSTANT_ATTRS: Dict[bytes, Dict[int, int]] = {}
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _walk_targets(
+        attr_matrix, node_attr, child_table, node_entropy, targets,
+        out_entropies, out_attrs, out_depths,
+    ):
+        """Walk every target through the flattened optimal tree in parallel.
+
+        ``node_attr[v]`` is the attribute asked at node ``v`` (-1 at a
+        leaf) and ``child_table[v, code]`` the node reached when the
+        answer carries that code.  For each target the kernel records the
+        per-step entropies, the asked attribute indices, and the number
+        of questions asked.
+        """
+        for t in prange(len(targets)):
+            node = 0
+            depth = 0
+            out_entropies[t, 0] = node_entropy[node]
+            while node_attr[node] >= 0:
+                attr_idx = node_attr[node]
+                code = attr_matrix[targets[t], attr_idx]
+                node = child_table[node, code]
+                out_attrs[t, depth] = attr_idx
+                depth += 1
+                out_entropies[t, depth] = node_entropy[node]
+            out_depths[t] = depth
+
+else:
+    _walk_targets = None
+
+
+# Precomputed log2 values for small candidate counts.  entropy_uniform is
+# called once per DP node and per simulation step, always with a count no
+# larger than the item universe, so a table lookup covers essentially
+# every call.
+_LOG2_TABLE_SIZE = 1024
+_LOG2_TABLE = tuple(math.log2(n) if n > 1 else 0.0 for n in range(_LOG2_TABLE_SIZE))
+
+
 def entropy_uniform(num_items: int) -> float:
     """Shannon entropy (in bits) of a uniform distribution over ``num_items`` objects."""
     if num_items <= 1:
         return 0.0
+    if num_items < _LOG2_TABLE_SIZE:
+        return _LOG2_TABLE[num_items]
     return math.log2(num_items)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class OracleState:
-    """Represents a candidate set of objects by their IDs.
-
-    We store the IDs as a sorted tuple so that each logical set has a
-    canonical, hashable representation suitable for memoization.
+    """Represents a candidate set of objects by their integer row indices.
+
+    The indices refer to rows of ``KaryOracleDP.attr_matrix`` and are kept
+    sorted so that each logical set has a canonical representation.  For
+    memoization the set is keyed by ``key``, a bitset over the fixed item
+    universe packed into one arbitrary-precision int (bit ``i`` is set iff
+    row ``i`` is a candidate), which is both hashable and far smaller than
+    the index array itself.
     """
 
-    ids: Tuple[ItemId, ...]
+    idx: np.ndarray
 
     @classmethod
-    def from_iterable(cls, ids: Iterable[ItemId]) -> "OracleState":
-        return cls(tuple(sorted(ids)))
+    def from_indices(cls, indices: Iterable[int]) -> "OracleState":
+        return cls(np.sort(np.asarray(list(indices), dtype=np.int32)))
+
+    @cached_property
+    def key(self) -> int:
+        """Bitset form of the candidate set (bit ``i`` set iff row ``i`` is in it)."""
+        if len(self.idx) == 0:
+            return 0
+        bits = np.zeros(int(self.idx[-1]) + 1, dtype=np.uint8)
+        bits[self.idx] = 1
+        return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
 
     def __len__(self) -> int:  # convenience
-        return len(self.ids)
+        return len(self.idx)
 
 
 class KaryOracleDP:
@@ -123,6 +197,11 @@ class KaryOracleDP:
     ----------
     attributes:
         The ordered tuple of attribute names considered askable by the oracle.
+    attr_matrix:
+        An ``(n_items, n_attrs)`` int32 matrix of factorized attribute
+        codes, where row ``i`` is object ``ids[i]`` and column ``j`` is
+        attribute ``attributes[j]``.  The dynamic program reads this dense
+        matrix instead of the nested ``items`` dicts.
     root_state:
         The initial candidate set containing all objects.
     """
@@ -133,47 +212,142 @@ class KaryOracleDP:
 
         self.items: ItemsDict = items
         # Fix a deterministic ordering of object IDs and attribute names.
+        self.ids: Tuple[ItemId, ...] = tuple(sorted(items.keys()))
+        self.id_to_idx: Dict[ItemId, int] = {
+            item_id: i for i, item_id in enumerate(self.ids)
+        }
         any_item = next(iter(items.values()))
         self.attributes: Tuple[str, ...] = tuple(sorted(any_item.keys()))
-        self.root_state = OracleState.from_iterable(items.keys())
+
+        # Factorize every attribute into dense 0..K-1 integer codes so the
+        # hot DP path scans one contiguous int32 matrix instead of doing
+        # two dict lookups per item per attribute.
+        n_items = len(self.ids)
+        n_attrs = len(self.attributes)
+        self.attr_codes: Tuple[Dict[str, int], ...] = tuple(
+            {} for _ in self.attributes
+        )
+        self.attr_matrix: np.ndarray = np.empty((n_items, n_attrs), dtype=np.int32)
+        for j, attr in enumerate(self.attributes):
+            codes = self.attr_codes[j]
+            for i, item_id in enumerate(self.ids):
+                value = items[item_id][attr]
+                self.attr_matrix[i, j] = codes.setdefault(value, len(codes))
+        self.attr_num_codes: np.ndarray = np.asarray(
+            [len(codes) for codes in self.attr_codes], dtype=np.int32
+        )
+
+        # Precompute, once, the bitset of rows holding each (attribute,
+        # code) pair.  Splitting any candidate state on an attribute then
+        # reduces to AND-ing the state bitset with these bucket masks,
+        # instead of re-bucketing the state's rows on every recursive call.
+        bucket_masks: List[Tuple[int, ...]] = []
+        for j in range(n_attrs):
+            column = self.attr_matrix[:, j]
+            bucket_masks.append(
+                tuple(
+                    OracleState(np.flatnonzero(column == code).astype(np.int32)).key
+                    for code in range(int(self.attr_num_codes[j]))
+                )
+            )
+        self.attr_bucket_masks: Tuple[Tuple[int, ...], ...] = tuple(bucket_masks)
+
+        self.root_state = OracleState.from_indices(range(n_items))
+
+        # Flattened optimal tree for the parallel trajectory kernel,
+        # built lazily by _flatten_optimal_tree().
+        self._flat_tree: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+        # Canonical fingerprint of the factorized table, used to share DP
+        # results between instances built over the same items.
+        fingerprint = hashlib.sha256()
+        fingerprint.update(repr(self.attributes).encode())
+        fingerprint.update(self.attr_matrix.tobytes())
+        self._table_key: bytes = fingerprint.digest()
+
+        # Hints for the DP: maps a state bitset to a bitmask of attribute
+        # indices already proven constant on a superset of that state (an
+        # attribute constant on a set is constant on every subset, so the
+        # hint is inherited from parent to child and never wrong).
+        self._constant_attrs: Dict[int, int] = _SHARED_CONSTANT_ATTRS.setdefault(
+            self._table_key, {}
+        )
 
     # ---- Dynamic program -------------------------------------------------
 
-    def _split_on_attribute(
-        self, state: OracleState, attribute: str
-    ) -> List[OracleState]:
-        """Partition a candidate state by the value of a single attribute.
+    def _split_on_attribute(self, key: int, attr_idx: int) -> List[int]:
+        """Partition a candidate bitset by the value of a single attribute.
 
-        Returns a list of non-empty child states.  If *all* candidates in
-        ``state`` share the same value for ``attribute``, the list has
-        length 1 and the split provides no information.
+        Returns a list of non-empty child bitsets, obtained by intersecting
+        ``key`` with the per-attribute bucket masks precomputed in
+        ``__init__``.  If *all* candidates share the same code for attribute
+        ``attr_idx``, the list has length 1 and the split provides no
+        information.
         """
-        buckets: Dict[str, List[ItemId]] = {}
-        for item_id in state.ids:
-            v = self.items[item_id][attribute]
-            buckets.setdefault(v, []).append(item_id)
+        children: List[int] = []
+        for bucket_mask in self.attr_bucket_masks[attr_idx]:
+            child = key & bucket_mask
+            if child:
+                children.append(child)
+        # Order children by their lowest set bit, i.e. by the first row of
+        # the state that lands in each bucket.  This reproduces the
+        # first-occurrence bucket order of the original dict-based split,
+        # so expected costs accumulate in the same order and exact ties
+        # between attributes resolve identically to the published curves.
+        children.sort(key=lambda child: child & -child)
+        return children
+
+    def _candidate_attributes(self, key: int) -> Iterable[int]:
+        """Yield indices of attributes that *could* split this state.
 
-        # Convert each non-empty bucket into a canonical OracleState.
-        return [OracleState.from_iterable(group) for group in buckets.values()]
+        We keep the logic simple and test every attribute; attributes whose
+        codes are already constant over the candidate set are discarded
+        inside ``_proper_splits``.
+        """
+        return range(len(self.attributes))
 
-    def _candidate_attributes(self, state: OracleState) -> Iterable[str]:
-        """Yield attributes that *could* split this state.
+    def _proper_splits(self, key: int) -> List[Tuple[int, List[int]]]:
+        """Return ``(attr_idx, children)`` for every attribute that properly
+        splits the candidate bitset ``key``.
 
-        We keep the logic simple and test every attribute; attributes whose
-        values are already constant over the candidate set are discarded
-        inside ``_solve_state``.
+        Attributes flagged constant by the inherited hint are skipped;
+        newly discovered non-splits update the hint, and each child is
+        seeded with the hint it inherits (including the attribute just
+        split on, which is single-valued on every child by construction).
         """
-        return self.attributes
+        splits: List[Tuple[int, List[int]]] = []
 
-    def _solve_state(self, state: OracleState) -> Tuple[float, Optional[str]]:
-        """Internal DP: return (optimal_expected_cost, best_attribute).
+        # Attributes proven constant on an ancestor state stay constant
+        # here, so they can be skipped without re-splitting.
+        constant = self._constant_attrs.get(key, 0)
 
-        The cost is the expected number of *additional* questions needed to
-        reach a leaf (an unsplittable equivalence class), starting from
-        ``state``, under the optimal policy.
+        for attr_idx in self._candidate_attributes(key):
+            if (constant >> attr_idx) & 1:
+                continue
+            children = self._split_on_attribute(key, attr_idx)
+            if len(children) <= 1:
+                # This attribute does not produce a proper split here.
+                constant |= 1 << attr_idx
+                continue
+            child_constant = constant | (1 << attr_idx)
+            for child in children:
+                self._constant_attrs.setdefault(child, child_constant)
+            splits.append((attr_idx, children))
+
+        self._constant_attrs[key] = constant
+        return splits
+
+    def _solve_state(self, key: int) -> Tuple[float, Optional[str]]:
+        """Combine step of the DP: return (optimal_expected_cost, best_attribute).
+
+        ``key`` is the bitset form of the candidate set.  The cost is the
+        expected number of *additional* questions needed to reach a leaf
+        (an unsplittable equivalence class), starting from that set, under
+        the optimal policy.  Every child subproblem is expected to be
+        memoized already; the iterative driver below guarantees this.
         """
 
-        n = len(state)
+        n = key.bit_count()
         if n <= 1:
             # Already uniquely identified: no more questions needed.
             return 0.0, None
@@ -181,22 +355,16 @@ class KaryOracleDP:
         best_cost = float("inf")
         best_attr: Optional[str] = None
 
-        for attr in self._candidate_attributes(state):
-            children = self._split_on_attribute(state, attr)
-            if len(children) <= 1:
-                # This attribute does not produce a proper split here.
-                continue
-
+        for attr_idx, children in self._proper_splits(key):
             # Expected residual cost under a uniform prior.
             expected_cost = 1.0  # cost of asking this attribute
             for child in children:
-                weight = len(child) / n
-                sub_cost, _ = self._solve_state(child)
-                expected_cost += weight * sub_cost
+                sub_cost, _ = self.solver(child)
+                expected_cost += (child.bit_count() / n) * sub_cost
 
             if expected_cost < best_cost:
                 best_cost = expected_cost
-                best_attr = attr
+                best_attr = self.attributes[attr_idx]
 
         if best_attr is None:
             # No attribute yields a split: this is an irreducible equivalence class.
@@ -205,12 +373,44 @@ class KaryOracleDP:
 
         return best_cost, best_attr
 
-    # Wrap the solver in an LRU cache keyed by the canonical state ids.
+    def _solve_iterative(self, root_key: int, memo: Dict[int, Tuple[float, Optional[str]]]) -> None:
+        """Evaluate the DP below ``root_key`` with an explicit post-order stack.
+
+        Equivalent to the natural recursion, but the search tree depth is
+        bounded only by available memory rather than by Python's recursion
+        limit, so deep, skewed split chains cannot raise RecursionError.
+        """
+        stack: List[int] = [root_key]
+        while stack:
+            key = stack[-1]
+            if key in memo:
+                stack.pop()
+                continue
+            pending = [
+                child
+                for _, children in self._proper_splits(key)
+                for child in children
+                if child not in memo
+            ]
+            if pending:
+                stack.extend(pending)
+            else:
+                # All children solved: combine.
+                memo[key] = self._solve_state(key)
+                stack.pop()
+
+    # The solver memoizes (cost, best_attribute) per canonical state bitset.
+    # The memo itself is shared module-wide between oracles built over the
+    # same attribute table.
     def _make_solver(self):
-        @lru_cache(maxsize=None)
-        def cached_solve(ids: Tuple[ItemId, ...]) -> Tuple[float, Optional[str]]:
-            state = OracleState(ids)
-            return self._solve_state(state)
+        memo = _SHARED_MEMOS.setdefault(self._table_key, {})
+
+        def cached_solve(key: int) -> Tuple[float, Optional[str]]:
+            result = memo.get(key)
+            if result is None:
+                self._solve_iterative(key, memo)
+                result = memo[key]
+            return result
 
         self._cached_solve = cached_solve  # type: ignore[attr-defined]
 
@@ -221,11 +421,53 @@ class KaryOracleDP:
             self._make_solver()
         return self._cached_solve  # type: ignore[attr-defined]
 
+    # Trajectories are deterministic given a start state and a target, so
+    # repeated simulations (e.g. re-running the 30-target averages) are
+    # answered from a cache keyed on (state bitset, target row).
+    def _make_simulator(self):
+        @lru_cache(maxsize=None)
+        def cached_simulate(
+            key: int, target_idx: int
+        ) -> Tuple[Tuple[float, ...], Tuple[str, ...]]:
+            current_key = key
+            n = current_key.bit_count()
+            entropies: List[float] = [entropy_uniform(n)]
+            asked: List[str] = []
+
+            while n > 1:
+                _, attr = self.solver(current_key)
+                if attr is None:
+                    # No attribute can split this candidate set any further.
+                    break
+
+                asked.append(attr)
+                attr_idx = self.attributes.index(attr)
+                target_code = int(self.attr_matrix[target_idx, attr_idx])
+
+                # Restrict the candidate set to objects consistent with the
+                # answer: one AND against the precomputed bucket bitset, no
+                # per-step rebuild of the candidate collection.
+                current_key &= self.attr_bucket_masks[attr_idx][target_code]
+                n = current_key.bit_count()
+
+                entropies.append(entropy_uniform(n))
+
+            return tuple(entropies), tuple(asked)
+
+        self._cached_simulate = cached_simulate  # type: ignore[attr-defined]
+
+    @property
+    def simulator(self):
+        """Return the memoized (cached) trajectory simulator."""
+        if not hasattr(self, "_cached_simulate"):
+            self._make_simulator()
+        return self._cached_simulate  # type: ignore[attr-defined]
+
     # ---- Public API ------------------------------------------------------
 
     def optimal_root_cost(self) -> float:
         """Expected number of questions from the prior state under the optimal policy."""
-        cost, _ = self.solver(self.root_state.ids)
+        cost, _ = self.solver(self.root_state.key)
         return cost
 
     def best_attribute_for_state(self, candidate_ids: Sequence[ItemId]) -> Optional[str]:
@@ -234,8 +476,10 @@ class KaryOracleDP:
         ``candidate_ids`` can be any iterable of IDs; it is canonicalized
         internally before the dynamic program is consulted.
         """
-        state = OracleState.from_iterable(candidate_ids)
-        _, attr = self.solver(state.ids)
+        state = OracleState.from_indices(
+            self.id_to_idx[item_id] for item_id in candidate_ids
+        )
+        _, attr = self.solver(state.key)
         return attr
 
     def simulate_target(self, target_id: ItemId) -> Tuple[List[float], List[str]]:
@@ -262,36 +506,172 @@ class KaryOracleDP:
         with size > 1, and the final entropy will be log2(class_size).
         """
 
-        if target_id not in self.items:
+        if target_id not in self.id_to_idx:
             raise KeyError(f"Unknown target ID: {target_id!r}")
+        target_idx = self.id_to_idx[target_id]
 
-        # Start from the full candidate set.
-        current_ids = set(self.root_state.ids)
-        entropies: List[float] = [entropy_uniform(len(current_ids))]
-        asked: List[str] = []
+        # Start from the full candidate set; the heavy lifting is cached.
+        entropies, asked = self.simulator(self.root_state.key, target_idx)
+        return list(entropies), list(asked)
 
-        while True:
-            if len(current_ids) <= 1:
-                break
+    def simulate_targets(
+        self, target_ids: Sequence[ItemId]
+    ) -> Dict[ItemId, Tuple[List[float], List[str]]]:
+        """Simulate the optimal policy for a whole batch of hidden targets.
 
-            attr = self.best_attribute_for_state(tuple(current_ids))
-            if attr is None:
-                # No attribute can split this candidate set any further.
-                break
+        Parameters
+        ----------
+        target_ids:
+            IDs of the hidden targets (e.g. the 30 sampled evaluation
+            targets).  Each must be a key in ``self.items``.
+
+        Returns
+        -------
+        A dict mapping each requested ID to the same ``(entropies,
+        asked_attributes)`` pair that ``simulate_target`` returns.
+
+        Notes
+        -----
+        Equivalent to looping ``simulate_target`` over the IDs.  With
+        numba installed, the optimal tree is flattened once into dense
+        arrays and every target walks it in a parallel (prange) kernel;
+        otherwise the batch is advanced through the tree level by level,
+        where targets sitting in the same node share one solver lookup
+        and one split per step.
+        """
 
-            asked.append(attr)
-            target_value = self.items[target_id][attr]
+        for target_id in target_ids:
+            if target_id not in self.id_to_idx:
+                raise KeyError(f"Unknown target ID: {target_id!r}")
+        targets = np.asarray(
+            [self.id_to_idx[target_id] for target_id in target_ids], dtype=np.int32
+        )
+
+        if _walk_targets is not None:
+            node_attr, child_table, node_entropy = self._flatten_optimal_tree()
+            n_targets = len(targets)
+            n_attrs = len(self.attributes)
+            # An attribute is constant on every child of the node that
+            # split on it, so no trajectory asks more than n_attrs
+            # questions.
+            out_entropies = np.empty((n_targets, n_attrs + 1), dtype=np.float64)
+            out_attrs = np.empty((n_targets, n_attrs), dtype=np.int32)
+            out_depths = np.empty(n_targets, dtype=np.int32)
+            _walk_targets(
+                self.attr_matrix, node_attr, child_table, node_entropy,
+                targets, out_entropies, out_attrs, out_depths,
+            )
+            return {
+                target_id: (
+                    list(out_entropies[pos, : out_depths[pos] + 1]),
+                    [self.attributes[a] for a in out_attrs[pos, : out_depths[pos]]],
+                )
+                for pos, target_id in enumerate(target_ids)
+            }
 
-            # Restrict the candidate set to objects consistent with the answer.
-            current_ids = {
-                obj_id
-                for obj_id in current_ids
-                if self.items[obj_id][attr] == target_value
+        root_key = self.root_state.key
+        prior = entropy_uniform(root_key.bit_count())
+        entropies: List[List[float]] = [[prior] for _ in target_ids]
+        asked: List[List[str]] = [[] for _ in target_ids]
+
+        # Frontier: node bitset -> positions (into ``target_ids``) of the
+        # targets currently sitting in that node of the optimal tree.
+        frontier: Dict[int, np.ndarray] = {root_key: np.arange(len(targets))}
+
+        while frontier:
+            grouped: Dict[int, List[np.ndarray]] = {}
+            for key, members in frontier.items():
+                if key.bit_count() <= 1:
+                    continue
+                _, attr = self.solver(key)
+                if attr is None:
+                    # Irreducible equivalence class: trajectory ends here.
+                    continue
+
+                attr_idx = self.attributes.index(attr)
+                codes = self.attr_matrix[targets[members], attr_idx]
+                for code in np.unique(codes):
+                    sub = members[codes == code]
+                    child = key & self.attr_bucket_masks[attr_idx][int(code)]
+                    child_entropy = entropy_uniform(child.bit_count())
+                    for pos in sub:
+                        asked[pos].append(attr)
+                        entropies[pos].append(child_entropy)
+                    grouped.setdefault(child, []).append(sub)
+
+            frontier = {
+                key: np.concatenate(parts) for key, parts in grouped.items()
             }
 
-            entropies.append(entropy_uniform(len(current_ids)))
+        return {
+            target_id: (entropies[pos], asked[pos])
+            for pos, target_id in enumerate(target_ids)
+        }
+
+    def _flatten_optimal_tree(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Flatten the optimal decision tree into dense arrays.
+
+        Returns ``(node_attr, child_table, node_entropy)``: for node ``v``
+        (the root is node 0), ``node_attr[v]`` is the index of the
+        attribute asked there or -1 at a leaf, ``child_table[v, code]``
+        the child reached when the answer carries ``code`` (-1 if no
+        candidate in ``v`` does), and ``node_entropy[v]`` the entropy of
+        the node's candidate set.  The flattened form is cached on the
+        instance and feeds the parallel trajectory kernel.
+        """
+        if self._flat_tree is not None:
+            return self._flat_tree
+
+        root_key = self.root_state.key
+        key_to_node: Dict[int, int] = {root_key: 0}
+        queue: List[int] = [root_key]
+        attrs: List[int] = []
+        entropies: List[float] = []
+        children: List[Dict[int, int]] = []
+
+        head = 0
+        while head < len(queue):
+            key = queue[head]
+            head += 1
+            n = key.bit_count()
+            entropies.append(entropy_uniform(n))
+
+            attr: Optional[str] = None
+            if n > 1:
+                _, attr = self.solver(key)
+            if attr is None:
+                attrs.append(-1)
+                children.append({})
+                continue
 
-        return entropies, asked
+            attr_idx = self.attributes.index(attr)
+            attrs.append(attr_idx)
+            row: Dict[int, int] = {}
+            for code, bucket_mask in enumerate(self.attr_bucket_masks[attr_idx]):
+                child = key & bucket_mask
+                if not child:
+                    continue
+                node = key_to_node.get(child)
+                if node is None:
+                    node = len(queue)
+                    key_to_node[child] = node
+                    queue.append(child)
+                row[code] = node
+            children.append(row)
+
+        n_nodes = len(queue)
+        max_codes = int(self.attr_num_codes.max())
+        node_attr = np.asarray(attrs, dtype=np.int32)
+        node_entropy = np.asarray(entropies, dtype=np.float64)
+        child_table = np.full((n_nodes, max_codes), -1, dtype=np.int32)
+        for v, row in enumerate(children):
+            for code, node in row.items():
+                child_table[v, code] = node
+
+        self._flat_tree = (node_attr, child_table, node_entropy)
+        return self._flat_tree
 
 
 # -------------------------------------------------------------------------
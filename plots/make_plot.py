@@ -0,0 +1,176 @@
+"""Regenerate the entropy plots for all K-ary OQA datasets in one pass.
+
+This replaces the three near-identical per-dataset ``plots/make_plot.py``
+scripts.  Each of those paid the interpreter startup and the
+pandas/numpy/matplotlib import cost (roughly a second cold) just to draw
+one figure; here the imports happen once and a single Figure object is
+recycled across datasets via ``fig.clear()``.
+
+Each dataset is described by a small config entry (CSV path, title,
+output PNGs, color map).  Run from the repository root:
+
+    python plots/make_plot.py
+"""
+
+import matplotlib
+
+# Headless backend: we only ever save PNGs, and Agg is much faster to
+# initialize than an interactive backend.
+matplotlib.use("Agg")
+
+import io
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Models in the desired legend order (shared by all K-ary datasets)
+ORDER = ["GPT 5", "Gemini 2.5 Pro", "Claude Sonnet 4.5", "Grok 4", "Oracle (Optimal)"]
+
+# Only these summary columns are plotted; naming the columns and dtypes up
+# front lets the CSV reader skip the rest and avoid per-column type inference.
+SUMMARY_USECOLS = ["model", "step", "entropy_bits_mean", "entropy_bits_std"]
+SUMMARY_DTYPES = {
+    "model": str,
+    "step": np.int32,
+    "entropy_bits_mean": np.float64,
+    "entropy_bits_std": np.float64,
+}
+
+KARY100_CFG = {
+    "csv_path": REPO_ROOT / "100-kary-oqa-dataset" / "plots" / "kary100_entropy_summary.csv",
+    "title": "K-ary 100 Objects Dataset: Entropy (in bits) Across Steps",
+    "out_pngs": ["kary100_entropy_plot.png"],
+    "color_map": {
+        "GPT 5": "tab:blue",
+        "Gemini 2.5 Pro": "tab:orange",
+        "Claude Sonnet 4.5": "tab:green",
+        "Grok 4": "tab:red",
+        "Oracle (Optimal)": "violet",
+    },
+}
+
+KARY200_CFG = {
+    "csv_path": REPO_ROOT / "200-kary-oqa-dataset" / "plots" / "kary200_entropy_summary.csv",
+    "title": "K-ary 200 Objects Dataset: Entropy (in bits) Across Steps",
+    "out_pngs": ["kary200_entropy_plot.png"],
+    "color_map": {
+        "GPT 5": "#003153",  # Prussian Blue
+        "Gemini 2.5 Pro": "orange",
+        "Claude Sonnet 4.5": "green",
+        "Grok 4": "red",
+        "Oracle (Optimal)": "violet",
+    },
+}
+
+KARY300_CFG = {
+    "csv_path": REPO_ROOT / "300-kary-oqa-dataset" / "plots" / "kary300_entropy_summary.csv",
+    "title": "K-ary 300 Objects Dataset: Entropy (in bits) Across Steps",
+    # The second PNG is kept for backward compatibility (see plots/README.txt).
+    "out_pngs": ["kary300_entropy_plot.png", "kary300_entropy_plot_30targets.png"],
+    "color_map": {
+        "GPT 5": "#003153",  # Prussian-ish blue
+        "Gemini 2.5 Pro": "tab:orange",
+        "Claude Sonnet 4.5": "tab:green",
+        "Grok 4": "red",
+        "Oracle (Optimal)": "violet",
+    },
+}
+
+CONFIGS = [KARY100_CFG, KARY200_CFG, KARY300_CFG]
+
+
+def render_entropy_plot(cfg, fig):
+    """Draw one dataset's entropy-vs-step figure and save its PNG(s).
+
+    ``fig`` is cleared and reused so the caller can recycle a single
+    Figure object across datasets instead of re-allocating one per plot.
+    """
+    fig.clear()
+    ax = fig.add_subplot(111)
+
+    df = pd.read_csv(cfg["csv_path"], usecols=SUMMARY_USECOLS, dtype=SUMMARY_DTYPES)
+
+    # Resolve the legend colors to RGBA up front, aligned with ORDER, so
+    # neither the dict lookup nor matplotlib's color-spec parser runs per
+    # artist.  Models missing from the map keep None (backend color cycle).
+    model_colors = [
+        to_rgba(cfg["color_map"][model]) if model in cfg["color_map"] else None
+        for model in ORDER
+    ]
+
+    # Sort once and split into per-model groups in a single pass, instead
+    # of a full boolean scan + re-sort of the table for every model.
+    groups = dict(iter(df.sort_values("step").groupby("model", sort=False)))
+
+    for model, model_color in zip(ORDER, model_colors):
+        g = groups.get(model)
+        if g is None:
+            continue
+        x = g["step"].to_numpy()
+        y = g["entropy_bits_mean"].to_numpy()
+        std = g["entropy_bits_std"].to_numpy()
+
+        # Symmetric error bars, but clip the lower bar so it never
+        # implies negative entropy.
+        lower = np.minimum(std, y)
+        upper = std
+
+        # plt.errorbar creates one Line2D per error segment and cap; one
+        # plot call plus one LineCollection keeps the draw cost flat in
+        # the number of points.
+        (line,) = ax.plot(x, y, "-o", label=model, color=model_color)
+        color = line.get_color()
+
+        segments = np.column_stack([x, y - lower, x, y + upper]).reshape(-1, 2, 2)
+        ax.add_collection(
+            LineCollection(segments, colors=color, linewidths=1.0, rasterized=True)
+        )
+
+        # Error-bar caps as a single scatter of "_" markers.
+        ax.scatter(
+            np.concatenate([x, x]),
+            np.concatenate([y - lower, y + upper]),
+            marker="_",
+            color=color,
+            s=36,
+            rasterized=True,
+        )
+
+    ax.set_title(cfg["title"])
+    ax.set_xlabel("Step")
+    ax.set_ylabel("Entropy = log2(# of Remaining Options)")
+    ax.grid(True, alpha=0.2)
+    ax.legend()
+    fig.tight_layout()
+
+    # Encode the PNG once into memory — at zlib's fastest compression
+    # level, since these plots are regenerated often and a few extra KB
+    # don't matter — then write the same bytes to every output path (the
+    # kary300 config saves the figure under two names).
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=160, pil_kwargs={"compress_level": 1})
+    data = buf.getvalue()
+
+    out_dir = cfg["csv_path"].parent
+    for out_png in cfg["out_pngs"]:
+        (out_dir / out_png).write_bytes(data)
+
+
+def main():
+    # The "fast" style trades sub-pixel niceties (path simplification,
+    # chunked drawing) for render speed, which is all we need for PNGs.
+    with matplotlib.style.context("fast"):
+        fig = plt.figure(figsize=(9, 5))
+        for cfg in CONFIGS:
+            render_entropy_plot(cfg, fig)
+        plt.close(fig)
+
+
+if __name__ == "__main__":
+    main()